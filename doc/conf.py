@@ -53,7 +53,6 @@ autosummary_generate = True
 
 autodoc_mock_imports = [
     "numpy",
-    "six",
     "xarray",
     "scipy",
     "os",
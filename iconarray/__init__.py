@@ -11,6 +11,7 @@ from .core.interpolate import remap_ICON_to_ICON, remap_ICON_to_regulargrid
 from .core.utilities import (
     add_coordinates,
     get_stats,
+    get_stats_da,
     ind_from_latlon,
     show_data_vars,
     wilks,
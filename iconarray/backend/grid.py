@@ -1,14 +1,14 @@
 """The grid module contains functions relating to the grid information for ICON data, such as merging ICON data with the grid data to provide one merged dataset."""
 
-import codecs
+import functools
 import logging
+import os
 import pathlib
 import sys
 
 import cfgrib
 import cfgrib.messages as messages
 import numpy as np
-import six
 import xarray as xr
 
 
@@ -117,7 +117,8 @@ def combine_grid_information(file, grid_file):
     if isinstance(file, pathlib.PurePath) or isinstance(file, str):
         ds = open_dataset(file)
     elif isinstance(file, xr.core.dataset.Dataset):
-        ds = file
+        # shallow copy, so that setting attributes and encodings below does not modify the input
+        ds = file.copy(deep=False)
     else:
         raise TypeError("""data file could not be opened to xr.core.dataset.Dataset.""")
 
@@ -153,10 +154,10 @@ def combine_grid_information(file, grid_file):
     if "edge" in ds.dims:
         ds = add_edge_data(ds, grid)
 
-    for _k, v in six.iteritems(ds.data_vars):
-        if "cell" in ds.data_vars[v.name].dims:
+    for v in ds.data_vars.values():
+        if "cell" in v.dims:
             _add_cell_encoding(v)
-        if "edge" in ds.data_vars[v.name].dims:
+        if "edge" in v.dims:
             _add_edge_encoding(v)
 
     return ds
@@ -492,32 +493,33 @@ def open_dataset(
 
 
 def _identify_datatype(file):
-    if _identifyNC(file):
-        return "nc"
-    elif _identifyGRIB(file):
-        return "grib"
-    else:
-        return False
+    # Identifies if NETCDF or GRIB data and return "nc", "grib" or False.
+    # The result is cached for each file and modification time.
+    try:
+        mtime_ns = os.stat(file).st_mtime_ns
+    except OSError:
+        return _datatype_from_magic(_read_magic(file))
+    return _cached_datatype(os.fspath(file), mtime_ns)
 
 
-def _identifyNC(file):
-    # Identifies if NETCDF data and return True or False.
-    msg = False
-    with codecs.open(file, "r", encoding="utf-8", errors="ignore") as fdata:
-        fd = fdata.read(3)
-    if fd in ["CDF", "HDF"]:
-        msg = True
-    return msg
+@functools.lru_cache(maxsize=128)
+def _cached_datatype(file, mtime_ns):
+    return _datatype_from_magic(_read_magic(file))
 
 
-def _identifyGRIB(file):
-    # Identifies if GRIB data and return True or False.
-    with codecs.open(file, "r", encoding="utf-8", errors="ignore") as file:
-        file_type = file.read(4)
-        if file_type.lower() == "grib":
-            return True
-        else:
-            return False
+def _read_magic(file):
+    # Only the magic number is read: "CDF" for netCDF3, "\x89HDF" for netCDF4, "GRIB".
+    with open(file, "rb") as fdata:
+        return fdata.read(4)
+
+
+def _datatype_from_magic(head):
+    if head[:3] == b"CDF" or head[1:4] == b"HDF":
+        return "nc"
+    elif head.lower() == b"grib":
+        return "grib"
+    else:
+        return False
 
 
 def filter_by_var(dataset, variable):
@@ -626,7 +628,7 @@ def show_GRIB_shortnames(file):
     TypeError
         If non-GRIB file is provided.
     """
-    if _identifyGRIB(file):
+    if _identify_datatype(file) == "grib":
         index_keys = ["shortName"]
         stream = messages.FileStream(file, errors="warn")
         index = messages.FileIndex.from_indexpath_or_filestream(
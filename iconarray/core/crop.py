@@ -201,14 +201,17 @@ class Crop:
         lat_bnds: list[float],
         scale_factor=0.3,
     ):
-        grid_lon_bnds = [
-            np.amin(grid.coords["clon"].data),
-            np.amax(grid.coords["clon"].data),
-        ]
-        grid_lat_bnds = [
-            np.amin(grid.coords["clat"].data),
-            np.amax(grid.coords["clat"].data),
-        ]
+        # computed together, so that dask-backed coordinates are read in a single pass
+        grid_bnds = xr.Dataset(
+            {
+                "lon_min": grid.coords["clon"].min(),
+                "lon_max": grid.coords["clon"].max(),
+                "lat_min": grid.coords["clat"].min(),
+                "lat_max": grid.coords["clat"].max(),
+            }
+        ).compute()
+        grid_lon_bnds = [grid_bnds["lon_min"].item(), grid_bnds["lon_max"].item()]
+        grid_lat_bnds = [grid_bnds["lat_min"].item(), grid_bnds["lat_max"].item()]
 
         if (
             (lon_bnds[0] > grid_lon_bnds[1])
@@ -382,8 +385,14 @@ class Crop:
         -------
         a (new) cropped dataset
         """
-        res = ds
+        res = ds.copy(deep=False)
         for loc in ["cell", "edge", "vertex"]:
-            if loc in ds.dims:
-                res = res.sel({loc: self.idx_sublist[loc]})
+            if loc not in ds.dims:
+                continue
+            # the indices are sorted and unique, so a sublist as long as the
+            # full grid (and the data) selects every location and is skipped
+            n_loc = len(self.idx_sublist[loc])
+            if n_loc == self.full_grid.sizes.get(loc) == ds.sizes[loc]:
+                continue
+            res = res.sel({loc: self.idx_sublist[loc]})
         return res
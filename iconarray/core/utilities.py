@@ -1,15 +1,15 @@
 """
 The utilities.py module contains various functions useful for analysing or plotting (ICON) data using xarray.
 
-Contains public functions: ind_from_latlon, add_coordinates, get_stats wilks, show_data_vars
+Contains public functions: ind_from_latlon, add_coordinates, get_stats, get_stats_da, wilks, show_data_vars
 """
 
+import weakref
 from typing import List
 
 import numpy as np
-import six
 import xarray as xr
-from scipy import stats
+from scipy import special
 from sklearn.neighbors import BallTree
 
 
@@ -45,6 +45,7 @@ def ind_from_latlon(
     lat_point: float,
     n: int = 1,
     verbose: bool = False,
+    cache: bool = False,
 ) -> List[int]:
     """
     Find the indices of the n closest cells in a grid, relative to a given latitude/longitude point.
@@ -66,6 +67,11 @@ def ind_from_latlon(
         The number of closest points to return. Default is 1.
     verbose: bool, optional
         Print information. Defaults to False.
+    cache: bool, optional
+        Keep the BallTree for later calls with the same coordinate arrays, which
+        then skip building it. The arrays must not be modified in place while
+        cached, eg. with np.rad2deg(lons.values, out=lons.values), as the tree of
+        the old coordinates would be used. Defaults to False.
 
     Returns
     -------
@@ -88,6 +94,7 @@ def ind_from_latlon(
     ...         lats,lons,lat,lon,
     ...         verbose=True, n=1
     ...         )
+    >>> # Pass cache=True to reuse the BallTree of lats and lons for further points
 
     >>> ind
     3352
@@ -118,21 +125,14 @@ def ind_from_latlon(
                 return indices
         return [indices]
 
-    # Convert Input to radians
-    lon_array, lat_array, lon_point, lat_point = [
-        np.deg2rad(arr) for arr in [lon_array, lat_array, lon_point, lat_point]
-    ]
-
-    # Create a 2D array of lon and lat coordinates
-    lon_lat_array = np.column_stack(
-        (lon_array.values.flatten(), lat_array.values.flatten())
-    )
-
-    # Build a BallTree from this 2D array using the Haversine distance
-    tree = BallTree(lon_lat_array, metric="haversine")
+    # Build a BallTree from the lon and lat coordinates using the Haversine distance
+    if cache:
+        tree = _get_balltree(lon_array.values, lat_array.values)
+    else:
+        tree = _build_balltree(lon_array.values, lat_array.values)
 
-    # Find the index of the nearest neighbor(s) of the given point
-    points = np.column_stack((lon_point, lat_point))
+    # Find the index of the nearest neighbor(s) of the given point, converted to radians
+    points = np.deg2rad(np.column_stack((lon_point, lat_point)))
     _, indices = tree.query(points, k=n)
 
     # Convert index to 2D indices if applicable, e.g., when using output remapped to lat-lon grind
@@ -146,16 +146,12 @@ def ind_from_latlon(
 
     # Print verbose information if requested
     if verbose:
-        closest_lats = " ".join(
-            f"{num:.4f}" for num in np.rad2deg(lat_array.values[indices])
-        )
-        closest_lons = " ".join(
-            f"{num:.4f}" for num in np.rad2deg(lon_array.values[indices])
-        )
+        closest_lats = " ".join(f"{num:.4f}" for num in lat_array.values[indices])
+        closest_lons = " ".join(f"{num:.4f}" for num in lon_array.values[indices])
 
         indices_str = " ".join(map(str, indices.tolist()))
-        given_lat_str = f"{np.rad2deg(lat_point):.4f}"
-        given_lon_str = f"{np.rad2deg(lon_point):.4f}"
+        given_lat_str = f"{lat_point:.4f}"
+        given_lon_str = f"{lon_point:.4f}"
 
         print(f"Closest indices: {indices_str}")
         print(
@@ -168,6 +164,42 @@ def ind_from_latlon(
     return indices
 
 
+# BallTrees of recently used coordinate arrays, keyed by the ids of the arrays.
+_BALLTREE_CACHE = {}
+_BALLTREE_CACHE_SIZE = 8
+
+
+def _build_balltree(lon_values, lat_values):
+    """Return a BallTree of the given lon and lat coordinates [degree] using the Haversine distance."""
+    # Fill a 2D array of lon and lat coordinates, converting to radians in place
+    lon_lat_array = np.empty((lon_values.size, 2), dtype=np.float64)
+    np.deg2rad(lon_values.ravel(), out=lon_lat_array[:, 0])
+    np.deg2rad(lat_values.ravel(), out=lon_lat_array[:, 1])
+    return BallTree(lon_lat_array, metric="haversine")
+
+
+def _get_balltree(lon_values, lat_values):
+    """
+    Return a cached BallTree of the given lon and lat coordinates [degree].
+
+    The tree is cached as long as the coordinate arrays are alive, so that repeated
+    calls on the same grid skip flattening, converting and indexing the coordinates.
+    The coordinate arrays must not be modified in place after the first call.
+    """
+    key = (id(lon_values), id(lat_values))
+    cached = _BALLTREE_CACHE.get(key)
+    if cached is not None:
+        lon_ref, lat_ref, tree = cached
+        if lon_ref() is lon_values and lat_ref() is lat_values:
+            return tree
+
+    tree = _build_balltree(lon_values, lat_values)
+    if len(_BALLTREE_CACHE) >= _BALLTREE_CACHE_SIZE:
+        del _BALLTREE_CACHE[next(iter(_BALLTREE_CACHE))]
+    _BALLTREE_CACHE[key] = (weakref.ref(lon_values), weakref.ref(lat_values), tree)
+    return tree
+
+
 def add_coordinates(lon, lat, lonmin, lonmax, latmin, latmax):
     """
     Get the position of given lat/lon coordinates in relation to the bounds of regular lat/lon grid.
@@ -254,14 +286,80 @@ def get_stats(varin1, varin2):
     >>> # Get data points, which are significantly different at level 0.05
     >>> pval_sig = np.argwhere(var_pval>0.05)
     """
-    varin1_mean = np.mean(varin1, axis=0)
-    varin2_mean = np.mean(varin2, axis=0)
+    # as arrays, so that xr.DataArray inputs are not reduced with skipna
+    return _get_stats(np.asarray(varin1), np.asarray(varin2), axis=0)
+
+
+def _get_stats(varin1, varin2, axis):
+    varin1_mean = np.mean(varin1, axis=axis)
+    varin2_mean = np.mean(varin2, axis=axis)
     varin_diff = varin2_mean - varin1_mean
-    # compute p values
-    pval = stats.ttest_ind(varin1, varin2, 0)[1]
+    # compute p values of the two-sided T-test assuming equal variances
+    # (same result as scipy.stats.ttest_ind, without its per-call overhead)
+    n1 = np.shape(varin1)[axis]
+    n2 = np.shape(varin2)[axis]
+    df = n1 + n2 - 2
+    var1 = np.var(varin1, axis=axis, ddof=1)
+    var2 = np.var(varin2, axis=axis, ddof=1)
+    pooled_std = np.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / df)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tval = -varin_diff / (pooled_std * np.sqrt(1.0 / n1 + 1.0 / n2))
+    pval = 2 * special.stdtr(df, -np.abs(tval))
     return varin1_mean, varin2_mean, varin_diff, pval
 
 
+def get_stats_da(da1, da2, dim="time"):
+    """
+    Get mean, difference of mean and p value for the T-test of the means of two independent samples (da1, da2) along a dimension.
+
+    Same as get_stats, but operates on xarray DataArrays and is evaluated lazily
+    if the data is backed by dask, so that the data does not need to fit into memory.
+
+    Parameters
+    ----------
+    da1 : xr.DataArray
+        First sample
+    da2 : xr.DataArray
+        Second sample (must have the same shape as da1, except along dim)
+    dim : str, optional
+        Dimension along which the samples are taken. Must not be split over several dask chunks. Defaults to 'time'.
+
+    Returns
+    ----------
+    da1_mean: xr.DataArray
+        Mean of first sample
+    da2_mean: xr.DataArray
+        Mean of second sample
+    da_diff: xr.DataArray
+        Difference of means
+    pval: xr.DataArray
+        p-value for the T-test of the means
+
+    See Also
+    ----------
+    iconarray.core.utilities
+
+    Examples
+    ----------
+    >>> # Get means, difference and p values chunk by chunk
+    >>> ds1 = ds1.chunk({"time": -1, "ncells": 50000})
+    >>> ds2 = ds2.chunk({"time": -1, "ncells": 50000})
+    >>> var1_mean, var2_mean, var_diff, var_pval = iconarray.get_stats_da(ds1['T'], ds2['T'])
+    >>> var_pval = var_pval.compute()
+    """
+    return xr.apply_ufunc(
+        _get_stats,
+        da1,
+        da2,
+        kwargs={"axis": -1},
+        input_core_dims=[[dim], [dim]],
+        output_core_dims=[[], [], [], []],
+        exclude_dims={dim},
+        dask="parallelized",
+        output_dtypes=[float] * 4,
+    )
+
+
 def wilks(pvals, alpha):
     """
     Get threshold for p-values at which differences are significant at level alpha if the dependency of data points is accounted for according to Wilks et al. 2016 (https://doi.org/10.1175/BAMS-D-15-00267.1).
@@ -290,15 +388,23 @@ def wilks(pvals, alpha):
     >>> pval_sig = np.argwhere(var_pval>pfdr)
     """
     pval_1d = pvals.ravel()
-    pval_rank = np.sort(pval_1d)
     N = np.size(pvals)
     alpha_fdr = 2 * alpha
-    for i in range(len(pval_rank)):
-        j = i + 1
-        if pval_rank[i] > (j / N) * alpha_fdr:
-            break
-    pfdr = pval_rank[i]
-    return pfdr
+    # Only the smallest p-values up to the first one above its threshold are needed,
+    # so sort a partition of the k smallest values and enlarge it until it contains the crossing.
+    k = min(N, max(8, int(alpha_fdr * N)))
+    while True:
+        if k < N:
+            pval_rank = np.partition(pval_1d, k - 1)[:k]
+        else:
+            pval_rank = pval_1d.copy()
+        pval_rank.sort()
+        exceeds = pval_rank > np.arange(1, k + 1) * (alpha_fdr / N)
+        if exceeds.any():
+            return pval_rank[np.argmax(exceeds)]
+        if k == N:
+            return pval_rank[-1]
+        k = min(2 * k, N)
 
 
 # show_data_vars can be used in python scripts to find out which variable name psyplot will need to plot that variable.
@@ -314,18 +420,17 @@ def show_data_vars(ds):
     ds : xr.Dataset
         Dataset of ICON GRIB data opened with cgrib engine or cfgrib.
     """
-    if type(ds) is str:
+    if isinstance(ds, str):
         Exception(
             "Argument is not a Dataset. Please open the dataset via psy.open_dataset() and pass returned Dataset to this function."
         )
-    elif type(ds) is xr.core.dataset.Dataset:
+    elif isinstance(ds, xr.Dataset):
         print(
             "{:<15} {:<32} {:<20} {:<20} {:<10}".format(
                 "psyplot name", "long_name", "GRIB_cfVarName", "GRIB_shortName", "units"
             )
         )
-        for _k, v in six.iteritems(ds.data_vars):
-            i = ds.data_vars[v.name]
+        for name, i in ds.data_vars.items():
             try:
                 long_name = (
                     (i.long_name[:28] + "..") if len(i.long_name) > 28 else i.long_name
@@ -346,6 +451,6 @@ def show_data_vars(ds):
                 gribshortName = ""
             print(
                 "{:<15} {:<32} {:<20} {:<20} {:<10}".format(
-                    v.name, long_name, gribcfvarName, gribshortName, units
+                    name, long_name, gribcfvarName, gribshortName, units
                 )
             )
@@ -2,16 +2,19 @@
 
 
 import configparser
+import copy
+import functools
+import re
 import sys
 from pathlib import Path
 
 import numpy as np
 
+_SEPARATOR = re.compile(r"\s*,\s*")
 
-def _get_several_input(config, sect, opt, f=False, i=False):
-    var = config.get(sect, opt)
-    var = var.replace(", ", ",")
-    var = var.split(",")
+
+def _get_several_input(value, f=False, i=False):
+    var = _SEPARATOR.split(value)
     if f:
         var = list(map(float, var))
     if i:
@@ -19,6 +22,95 @@ def _get_several_input(config, sect, opt, f=False, i=False):
     return var
 
 
+def _get_boolean(value):
+    try:
+        return configparser.ConfigParser.BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}")
+
+
+def _get_section(config, sect):
+    # all options of a section at once, instead of one lookup per option
+    if config.has_section(sect):
+        return dict(config.items(sect))
+    return {}
+
+
+def _read_options(items, options, defaults):
+    cfg = {opt: conv(items[opt]) for opt, conv in options.items() if opt in items}
+    for opt, default in defaults.items():
+        if opt not in cfg:
+            # copied, so that changing the returned lists does not change the defaults
+            cfg[opt] = copy.copy(default)
+    return cfg
+
+
+_get_floats = functools.partial(_get_several_input, f=True)
+_get_ints = functools.partial(_get_several_input, i=True)
+
+# conversion of the options of each section, and the defaults of the options that are always set
+_VAR_OPTIONS = {
+    "name": str,
+    "zname": str,
+    "varlim": _get_floats,
+    "grid_file": str,
+    "time": _get_ints,
+    "height": _get_ints,
+    "unc": str,
+}
+_VAR_DEFAULTS = {"zname": "height", "time": [0], "height": [0]}
+
+_MAP_OPTIONS = {
+    "lonmin": float,
+    "lonmax": float,
+    "latmin": float,
+    "latmax": float,
+    "add_grid": _get_boolean,
+    "projection": str,
+    "title": str,
+    "clabel": str,
+    "sig": int,
+    "sig_leg": _get_boolean,
+    "leg_loc": str,
+    "alpha": float,
+    "cmap": str,
+    "diff": str,
+    "col": str,
+    "marker": str,
+    "markersize": float,
+}
+_MAP_DEFAULTS = {
+    "sig": 0,
+    "sig_leg": 0,
+    "leg_loc": "best",
+    "alpha": 0.05,
+    "diff": "abs",
+    "col": "k",
+    "marker": ".",
+    "markersize": 0.5,
+}
+
+_COORD_OPTIONS = {
+    "name": _get_several_input,
+    "lon": _get_floats,
+    "lat": _get_floats,
+    "marker": _get_several_input,
+    "marker_size": _get_floats,
+    "col": _get_several_input,
+}
+_COORD_DEFAULTS = {"marker": ["*"], "marker_size": [10], "col": ["r"]}
+
+_PLOT_OPTIONS = {
+    "xlabel": str,
+    "ylabel": str,
+    "xlim": _get_floats,
+    "ylim": _get_floats,
+    "title": str,
+    "date_format": str,
+}
+_PLOT_DEFAULTS = {"date_format": "%Y-%m-%d %H:%M"}
+
+
 def read_config(config_path):
     """
     Parse configuration file for plotting scripts in icon-vis.
@@ -49,132 +141,32 @@ def read_config(config_path):
         sys.exit("Please provide a valid config file")
 
     # Read information regarding the variable
-    var = {}
-    if config.has_option("var", "name"):
-        var["name"] = config.get("var", "name")
-    else:
+    var_items = _get_section(config, "var")
+    if "name" not in var_items:
         sys.exit("No variable name given")
-    if config.has_option("var", "zname"):
-        var["zname"] = config.get("var", "zname")
-    else:
-        var["zname"] = "height"
-    if config.has_option("var", "varlim"):
-        var["varlim"] = _get_several_input(config, "var", "varlim", f=True)
-    if config.has_option("var", "grid_file"):
-        var["grid_file"] = config.get("var", "grid_file")
-    if config.has_option("var", "time"):
-        var["time"] = _get_several_input(config, "var", "time", i=True)
-    else:
-        var["time"] = [0]
-    if config.has_option("var", "height"):
-        var["height"] = _get_several_input(config, "var", "height", i=True)
-    else:
-        var["height"] = [0]
-    if config.has_option("var", "unc"):
-        var["unc"] = config.get("var", "unc")
+    var = _read_options(var_items, _VAR_OPTIONS, _VAR_DEFAULTS)
 
     # Read information regarding the map
-    map_cfg = {}
-    if config.has_option("map", "lonmin"):
-        map_cfg["lonmin"] = config.getfloat("map", "lonmin")
-    if config.has_option("map", "lonmax"):
-        map_cfg["lonmax"] = config.getfloat("map", "lonmax")
-    if config.has_option("map", "latmin"):
-        map_cfg["latmin"] = config.getfloat("map", "latmin")
-    if config.has_option("map", "latmax"):
-        map_cfg["latmax"] = config.getfloat("map", "latmax")
-    if config.has_option("map", "add_grid"):
-        map_cfg["add_grid"] = config.getboolean("map", "add_grid")
-    if config.has_option("map", "projection"):
-        map_cfg["projection"] = config.get("map", "projection")
-    if config.has_option("map", "title"):
-        map_cfg["title"] = config.get("map", "title")
-    if config.has_option("map", "clabel"):
-        map_cfg["clabel"] = config.get("map", "clabel")
-    if config.has_option("map", "sig"):
-        map_cfg["sig"] = config.getint("map", "sig")
-    else:
-        map_cfg["sig"] = 0
-    if config.has_option("map", "sig_leg"):
-        map_cfg["sig_leg"] = config.getboolean("map", "sig_leg")
-    else:
-        map_cfg["sig_leg"] = 0
-    if config.has_option("map", "leg_loc"):
-        map_cfg["leg_loc"] = config.get("map", "leg_loc")
-    else:
-        map_cfg["leg_loc"] = "best"
-    if config.has_option("map", "alpha"):
-        map_cfg["alpha"] = config.getfloat("map", "alpha")
-    else:
-        map_cfg["alpha"] = 0.05
-    if config.has_option("map", "cmap"):
-        map_cfg["cmap"] = config.get("map", "cmap")
-    if config.has_option("map", "diff"):
-        map_cfg["diff"] = config.get("map", "diff")
-    else:
-        map_cfg["diff"] = "abs"
-    if config.has_option("map", "col"):
-        map_cfg["col"] = config.get("map", "col")
-    else:
-        map_cfg["col"] = "k"
-    if config.has_option("map", "marker"):
-        map_cfg["marker"] = config.get("map", "marker")
-    else:
-        map_cfg["marker"] = "."
-    if config.has_option("map", "markersize"):
-        map_cfg["markersize"] = config.getfloat("map", "markersize")
-    else:
-        map_cfg["markersize"] = 0.5
+    map_cfg = _read_options(_get_section(config, "map"), _MAP_OPTIONS, _MAP_DEFAULTS)
 
     # Read information regarding coordinates
     coord = {}
     if config.has_section("coord"):
-        if config.has_option("coord", "name"):
-            coord["name"] = _get_several_input(config, "coord", "name")
-        if config.has_option("coord", "lon"):
-            coord["lon"] = _get_several_input(config, "coord", "lon", f=True)
-        if config.has_option("coord", "lat"):
-            coord["lat"] = _get_several_input(config, "coord", "lat", f=True)
-        if config.has_option("coord", "marker"):
-            coord["marker"] = _get_several_input(config, "coord", "marker")
-        else:
-            coord["marker"] = ["*"]
-        if len(coord["marker"]) < len(coord["lon"]):
-            coord["marker"] = np.repeat(coord["marker"][0], len(coord["lon"]))
-        if config.has_option("coord", "marker_size"):
-            coord["marker_size"] = _get_several_input(
-                config, "coord", "marker_size", f=True
-            )
-        else:
-            coord["marker_size"] = [10]
-        if len(coord["marker_size"]) < len(coord["lon"]):
-            coord["marker_size"] = np.repeat(coord["marker_size"][0], len(coord["lon"]))
-        if config.has_option("coord", "col"):
-            coord["col"] = _get_several_input(config, "coord", "col")
-        else:
-            coord["col"] = ["r"]
-        if len(coord["col"]) < len(coord["lon"]):
-            coord["col"] = np.repeat(coord["col"][0], len(coord["lon"]))
-        if config.has_option("coord", "name"):
-            coord["name"] = _get_several_input(config, "coord", "name")
-            if len(coord["name"]) < len(coord["lon"]):
-                coord["name"] = np.repeat(coord["name"][0], len(coord["lon"]))
+        coord = _read_options(
+            _get_section(config, "coord"), _COORD_OPTIONS, _COORD_DEFAULTS
+        )
+        # a single marker, size, colour or name is used for all coordinates
+        n = len(coord["lon"])
+        if len(coord["marker"]) < n:
+            coord["marker"] = [coord["marker"][0]] * n
+        if len(coord["marker_size"]) < n:
+            coord["marker_size"] = np.full(n, coord["marker_size"][0], dtype=float)
+        if len(coord["col"]) < n:
+            coord["col"] = [coord["col"][0]] * n
+        if "name" in coord and len(coord["name"]) < n:
+            coord["name"] = [coord["name"][0]] * n
 
     # Read information regarding plot
-    plot = {}
-    if config.has_option("plot", "xlabel"):
-        plot["xlabel"] = config.get("plot", "xlabel")
-    if config.has_option("plot", "ylabel"):
-        plot["ylabel"] = config.get("plot", "ylabel")
-    if config.has_option("plot", "xlim"):
-        plot["xlim"] = _get_several_input(config, "plot", "xlim", f=True)
-    if config.has_option("plot", "ylim"):
-        plot["ylim"] = _get_several_input(config, "plot", "ylim", f=True)
-    if config.has_option("plot", "title"):
-        plot["title"] = config.get("plot", "title")
-    if config.has_option("plot", "date_format"):
-        plot["date_format"] = config.get("plot", "date_format")
-    else:
-        plot["date_format"] = "%Y-%m-%d %H:%M"
+    plot = _read_options(_get_section(config, "plot"), _PLOT_OPTIONS, _PLOT_DEFAULTS)
 
     return [var, map_cfg, coord, plot]
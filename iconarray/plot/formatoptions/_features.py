@@ -0,0 +1,241 @@
+"""Helpers to build and cache the cartopy features drawn by the formatoptions."""
+
+import functools
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import cartopy.crs as ccrs
+import cartopy.io.shapereader as shpreader
+import numpy as np
+import shapely
+from cartopy.feature import Feature
+from matplotlib import rcParams
+
+# Loads the geometries of the features in the background, so that adding a
+# feature to the axes does not block until the shapefile is read.
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="iconarray-features")
+
+
+class _CulledFeature(Feature):
+    """
+    Feature drawing a fixed collection of geometries.
+
+    Unlike cartopy.feature.ShapelyFeature, whose geometries are all projected
+    and converted to paths by cartopy on every draw, only the geometries
+    intersecting the map extent are drawn. They are looked up in a spatial
+    index (shapely.STRtree), built on the first draw.
+
+    Parameters
+    ----------
+    load: Callable[[], Iterable[shapely.Geometry]]
+        Function returning the geometries of the feature. It is run in the
+        background and only waited for when the feature is drawn. If it
+        fails, it is run again on the next draw.
+    crs: cartopy.crs.CRS
+        The coordinate reference system of the geometries.
+    **kwargs
+        Keyword arguments used when drawing the feature.
+    """
+
+    def __init__(self, load, crs, **kwargs):
+        super().__init__(crs, **kwargs)
+        self._load = load
+        self._future = _EXECUTOR.submit(load)
+        self._geoms = None
+        self._tree = None
+
+    def _get_geoms(self):
+        if self._geoms is None:
+            try:
+                self._geoms = tuple(self._future.result())
+            except Exception:
+                # a failed load (eg. a download error) is retried on the next
+                # draw instead of failing for the rest of the session
+                self._future = _EXECUTOR.submit(self._load)
+                raise
+            self._future = None
+        return self._geoms
+
+    def geometries(self):
+        """Return an iterator of all geometries of the feature."""  # noqa
+        return iter(self._get_geoms())
+
+    def intersecting_geometries(self, extent):
+        """Return an iterator of the geometries intersecting the extent (x0, x1, y0, y1)."""  # noqa
+        if extent is None or np.isnan(extent[0]):
+            return self.geometries()
+        geoms = self._get_geoms()
+        if self._tree is None:
+            self._tree = shapely.STRtree(geoms)
+        bbox = shapely.box(extent[0], extent[2], extent[1], extent[3])
+        indices = self._tree.query(bbox, predicate="intersects")
+        return (geoms[i] for i in np.sort(indices))
+
+
+def _shown(value):
+    """Return whether the (validated) value of a feature formatoption draws the feature."""
+    return value is True or isinstance(value, dict)
+
+
+def _rasterized(value):
+    """Return whether the feature is rasterized, which can be disabled with {"rasterized": False}."""
+    return value.get("rasterized", True) if isinstance(value, dict) else True
+
+
+def _simplify_tolerance(ax):
+    """
+    Return the tolerance [degree] to simplify geometries without a visible difference on the axes.
+
+    The tolerance is half the size of a pixel, rounded down to a power of two,
+    so that similar extents share the same simplified geometries. Pixels are
+    measured at the savefig.dpi of matplotlib, if higher than the figure dpi.
+
+    Parameters
+    ----------
+    ax: cartopy.mpl.geoaxes.GeoAxes
+        The axes the geometries are drawn on.
+
+    Returns
+    -------
+    tolerance: float
+    """
+    extent = ax.get_extent(ccrs.PlateCarree())
+    dpi = ax.figure.dpi
+    if rcParams["savefig.dpi"] != "figure":
+        dpi = max(dpi, rcParams["savefig.dpi"])
+    # the window extent is in pixels at the figure dpi
+    width = ax.get_window_extent().width * dpi / ax.figure.dpi
+    if not width > 0 or not extent[1] > extent[0]:
+        return 0.0
+    tolerance = (extent[1] - extent[0]) / width / 2
+    return 2.0 ** math.floor(math.log2(tolerance))
+
+
+@functools.lru_cache(maxsize=8)
+def _natural_earth_geometries(category, name, scale):
+    """
+    Return the geometries of a Natural Earth shapefile, which is only downloaded and parsed once.
+
+    Parameters
+    ----------
+    category: str
+        Natural Earth category, eg. "physical" or "cultural".
+    name: str
+        Natural Earth dataset name, eg. "rivers_lake_centerlines".
+    scale: str
+        Natural Earth resolution, one of "10m", "50m" or "110m".
+
+    Returns
+    -------
+    geometries: tuple[shapely.Geometry]
+    """
+    path = shpreader.natural_earth(resolution=scale, category=category, name=name)
+    return tuple(shpreader.Reader(path).geometries())
+
+
+# Per-user directory of the geometries converted from shapefiles.
+_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "iconarray"
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _gshhs_geometries(scale, level):
+    """
+    Return the geometries of one level of the GSHHS dataset.
+
+    The geometries are saved as WKB to a per-user cache directory, so that later
+    sessions do not need to parse the GSHHS shapefile again.
+
+    Parameters
+    ----------
+    scale: str
+        GSHHS resolution, one of "c", "l", "i", "h" or "f".
+    level: int
+        GSHHS level, eg. 1 for land or 2 for lakes.
+
+    Returns
+    -------
+    geometries: tuple[shapely.Geometry]
+    """
+    cache_file = os.path.join(_CACHE_DIR, f"gshhs_{scale}_L{level}.npz")
+    try:
+        with np.load(cache_file, allow_pickle=False) as cached:
+            wkb, offsets = cached["wkb"].tobytes(), cached["offsets"]
+        return tuple(
+            shapely.from_wkb([wkb[i:j] for i, j in zip(offsets[:-1], offsets[1:])])
+        )
+    except (OSError, KeyError, ValueError):
+        # a missing or incomplete cache
+        pass
+    geoms = tuple(shpreader.Reader(shpreader.gshhs(scale, level)).geometries())
+    # the WKB of all geometries, concatenated, and the offset of each of them
+    wkbs = shapely.to_wkb(geoms)
+    offsets = np.cumsum([0] + [len(wkb) for wkb in wkbs])
+    try:
+        os.makedirs(_CACHE_DIR, mode=0o700, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            np.savez(f, wkb=np.frombuffer(b"".join(wkbs), np.uint8), offsets=offsets)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+    return geoms
+
+
+@functools.lru_cache(maxsize=16)
+def _simplified_geometries(category, name, scale, tolerance):
+    """
+    Return the geometries of a Natural Earth shapefile, simplified with the given tolerance.
+
+    Parameters
+    ----------
+    category: str
+        Natural Earth category, eg. "physical" or "cultural".
+    name: str
+        Natural Earth dataset name, eg. "rivers_lake_centerlines".
+    scale: str
+        Natural Earth resolution, one of "10m", "50m" or "110m".
+    tolerance: float
+        Tolerance [degree] passed to shapely.simplify.
+
+    Returns
+    -------
+    geometries: tuple[shapely.Geometry]
+    """
+    geoms = _natural_earth_geometries(category, name, scale)
+    if tolerance > 0:
+        geoms = shapely.simplify(geoms, tolerance, preserve_topology=False)
+    return tuple(geom for geom in geoms if not geom.is_empty)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_ne_feature(category, name, scale, tolerance, style=frozenset()):
+    """
+    Return a feature of the simplified geometries of a Natural Earth shapefile.
+
+    The features are shared between plotters, so that plots with the same
+    resolution and style reuse the same geometries (and the paths cartopy
+    caches for them).
+
+    Parameters
+    ----------
+    category: str
+        Natural Earth category, eg. "physical" or "cultural".
+    name: str
+        Natural Earth dataset name, eg. "rivers_lake_centerlines".
+    scale: str
+        Natural Earth resolution, one of "10m", "50m" or "110m".
+    tolerance: float
+        Tolerance [degree] passed to shapely.simplify.
+    style: frozenset
+        Items of the keyword arguments used when drawing the feature.
+
+    Returns
+    -------
+    feature: _CulledFeature
+        The geometries are loaded in the background until the feature is drawn.
+    """
+    load = functools.partial(_simplified_geometries, category, name, scale, tolerance)
+    return _CulledFeature(load, ccrs.PlateCarree(), **dict(style))
@@ -1,22 +1,48 @@
 """Formatoption that adds internal land borders on mapplot, mapvector, and mapcombined plots created by psyplot."""
 
+import cartopy.crs as ccrs
 import cartopy.feature as cf
 import psyplot.project as psy
 from psyplot.plotter import Formatoption
 
+from ._features import _get_ne_feature, _simplify_tolerance
+
+
+def _borders_feature(ax):
+    # same Natural Earth borders as cf.BORDERS, simplified to the resolution of the axes
+    scale = cf.BORDERS.scaler.scale_from_extent(ax.get_extent(ccrs.PlateCarree()))
+    return _get_ne_feature(
+        "cultural",
+        "admin_0_boundary_lines_land",
+        scale,
+        _simplify_tolerance(ax),
+        frozenset({"facecolor": "never"}.items()),
+    )
+
 
 class Borders(Formatoption):
     """Add internal land borders on mapplot, mapvector, and mapcombined plots created by psyplot."""
 
     children = ["lsm"]
+    dependencies = ["map_extent"]
     default = {"color": "black", "linewidth": 1.0}
 
+    #: the feature artist of the borders, if drawn
+    borders = None
+
+    #: the value and map extent of the last update
+    _last_state = None
+
     def validate(self, value):
         """Validate and convert the input to boolean or dictionary."""  # noqa
-        if type(value) is dict:
-            return value
-        else:
-            return bool(value)
+        if isinstance(value, dict):
+            return dict(value)
+        return bool(value)
+
+    def initialize_plot(self, value):
+        """Initialize the plot with or without borders."""  # noqa
+        self._last_state = None
+        self.update(value)
 
     def update(self, value):
         """
@@ -25,26 +51,44 @@ class Borders(Formatoption):
         Parameters
         ----------
         value: bool or Dict
-            True to add black borders, False to remove, or Dict with color and linewidth properties eg. {"color": "black", "linewidth": 1.0}
+            True to add black borders, False to remove, or Dict with color and linewidth properties eg. {"color": "black", "linewidth": 1.0}.
+            The borders are rasterized when saving to vector formats, unless the Dict contains "rasterized": False.
         """
-        if type(value) is dict:
-            self.borders = self.ax.add_feature(
-                cf.BORDERS, edgecolor=value["color"], linewidth=value["linewidth"]
-            )
-            self.lsm.update(
-                {"res": "10m", "linewidth": value["linewidth"], "coast": value["color"]}
-            )
-        elif value is True:
-            self.borders = self.ax.add_feature(
-                cf.BORDERS, edgecolor="black", linewidth=1.0
-            )
-            self.lsm.update({"res": "10m", "linewidth": 1.0, "coast": "black"})
+        state = (value, self.ax.get_extent())
+        if state == self._last_state:
+            return
+        self._remove()
+        self._DISPATCH.get(type(value), Borders._hide)(self, value)
+        self._last_state = state
+
+    def _show(self, value):
+        self.borders = self.ax.add_feature(
+            _borders_feature(self.ax),
+            edgecolor=value["color"],
+            linewidth=value["linewidth"],
+            rasterized=value.get("rasterized", True),
+        )
+        self.lsm.update(
+            {"res": "10m", "linewidth": value["linewidth"], "coast": value["color"]}
+        )
+
+    def _show_default(self, value):
+        if value is True:
+            self._show({"color": "black", "linewidth": 1.0})
         else:
-            if hasattr(self, "borders"):
-                self.borders.remove()
-                del self.borders
-            if hasattr(self, "lsm"):
-                self.lsm.update(None)
+            self._hide(value)
+
+    def _hide(self, value):
+        if hasattr(self, "lsm"):
+            self.lsm.update(None)
+
+    #: update method for each type of the (validated) value
+    _DISPATCH = {dict: _show, bool: _show_default}
+
+    def _remove(self):
+        if self.borders is not None:
+            self.borders.remove()
+            self.borders = None
 
 
 psy.plot.mapplot.plotter_cls.borders = Borders("borders")
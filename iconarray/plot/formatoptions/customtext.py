@@ -14,27 +14,47 @@ class CustomText(Formatoption):
     #: the default value for the formatoption
     default = False
 
+    #: the text artist, created on the first update with text
+    text = None
+
+    #: the value of the last update
+    _last_value = None
+
+    def initialize_plot(self, value):
+        """Initialize the plot with or without text."""  # noqa
+        self._last_value = None
+        self.update(value)
+
     def update(self, value):
         """Update the plot with text."""  # noqa
-        if type(value) is str:
-            if hasattr(self, "text"):
-                self._remove()
+        if value == self._last_value:
+            return
+        self._DISPATCH.get(type(value), CustomText._hide)(self, value)
+        self._last_value = value
+
+    def _show(self, value):
+        self._get_text().set_text(value)
+        self.text.set_visible(True)
+
+    def _hide(self, value):
+        if self.text is not None:
+            self.text.set_visible(False)
+
+    #: update method for each type of the value
+    _DISPATCH = {str: _show}
+
+    def _get_text(self):
+        # the text artist is created once and then only updated
+        if self.text is None or self.text.axes is not self.ax:
             self.text = self.ax.text(
                 0.0,
                 -0.15,
-                value,
+                "",
                 fontsize="xx-large",
                 # ha='right', va='top',   # text alignment,
                 transform=self.ax.transAxes,  # coordinate system transformation)
             )
-        elif value in [False, None] and hasattr(self, "text"):
-            self._remove()
-
-    def _remove(self):
-        if self.text is None:
-            return
-        self.text.remove()
-        del self.text
+        return self.text
 
 
 psy.plot.mapplot.plotter_cls.customtext = CustomText("customtext")
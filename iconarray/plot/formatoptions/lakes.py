@@ -1,9 +1,27 @@
 """Formatoption that adds lakes to mapplot, mapvector, and mapcombined plots created by psyplot."""
 
+import functools
+
+import cartopy.crs as ccrs
 import psyplot.project as psy
-from cartopy.feature import GSHHSFeature
 from psyplot.plotter import Formatoption
 
+from ._features import _CulledFeature, _gshhs_geometries, _rasterized, _shown
+
+
+@functools.lru_cache(maxsize=1)
+def _lakes_feature():
+    # lakes are level 2 of the high resolution GSHHS dataset, loaded in the background
+    return _CulledFeature(
+        functools.partial(_gshhs_geometries, "h", 2),
+        ccrs.PlateCarree(),
+        # the style of cartopy.feature.GSHHSFeature: outlines only, no fill
+        edgecolor="black",
+        facecolor="none",
+        alpha=0.8,
+        linewidth=0.4,
+    )
+
 
 class Lakes(Formatoption):
     """Add lakes to mapplot, mapvector, and mapcombined plots created by psyplot."""
@@ -11,31 +29,47 @@ class Lakes(Formatoption):
     #: the default value for the formatoption
     default = True
 
+    #: the feature artist of the lakes, if drawn
+    lakes = None
+
+    #: the value of the last update
+    _last_value = None
+
     def validate(self, value):
-        """Validate and convert the input to boolean."""  # noqa
+        """Validate and convert the input to boolean or dictionary."""  # noqa
+        if isinstance(value, dict):
+            return dict(value)
         return bool(value)
 
+    def initialize_plot(self, value):
+        """Initialize the plot with or without lakes."""  # noqa
+        self._last_value = None
+        self.update(value)
+
     def update(self, value):
         """
         Update plot to add (or remove) lakes.
 
         Parameters
         ----------
-        value: bool
+        value: bool or Dict
             True to add lakes, False to remove.
+            The lakes are rasterized when saving to vector formats, unless a Dict with "rasterized": False is given.
         """
         # method to update the plot
-        if value is True:
+        if value == self._last_value:
+            return
+        self._remove()
+        if _shown(value):
             self.lakes = self.ax.add_feature(
-                GSHHSFeature(scale="high", levels=[2], alpha=0.8, linewidth=0.4)
+                _lakes_feature(), rasterized=_rasterized(value)
             )
-        else:
-            self._remove()
+        self._last_value = value
 
     def _remove(self):
-        if hasattr(self, "lakes"):
+        if self.lakes is not None:
             self.lakes.remove()
-            del self.lakes
+            self.lakes = None
 
 
 psy.plot.mapplot.plotter_cls.lakes = Lakes("lakes")
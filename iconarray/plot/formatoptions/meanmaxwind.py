@@ -1,4 +1,5 @@
 """Formatoption that adds text containing mean and maximum wind within plotted data."""
+import numpy as np
 import psyplot.project as psy
 from psyplot.plotter import Formatoption
 
@@ -14,6 +15,9 @@ class MeanMaxWind(Formatoption):
     #: the default value for the formatoption
     default = False
 
+    #: the text artist, created on the first update with True
+    windtext = None
+
     def update(self, value):
         """
         Add or remove text with the mean and max wind speeds of the plotted data to the plot.
@@ -25,18 +29,20 @@ class MeanMaxWind(Formatoption):
         """
         # method to update the plot
         if value is True:
-            abs_mean = ((self.data[0] ** 2 + self.data[1] ** 2) ** 0.5).mean().values
-            abs_max = ((self.data[0] ** 2 + self.data[1] ** 2) ** 0.5).max().values
-            self.windtext = self.ax.text(
-                0.0,
-                -0.15,
-                "Mean: %1.1f, Max: %1.1f [%s]" % (abs_mean, abs_max, "m/s"),
-                transform=self.ax.transAxes,
+            wind_speed = np.hypot(self.data[0].values, self.data[1].values)
+            abs_mean = np.nanmean(wind_speed)
+            abs_max = np.nanmax(wind_speed)
+            # the text artist is created once and then only updated
+            if self.windtext is None or self.windtext.axes is not self.ax:
+                self.windtext = self.ax.text(
+                    0.0, -0.15, "", transform=self.ax.transAxes
+                )
+            self.windtext.set_text(
+                "Mean: %1.1f, Max: %1.1f [%s]" % (abs_mean, abs_max, "m/s")
             )
-        else:
-            if hasattr(self, "windtext"):
-                self.windtext.remove()
-                del self.windtext
+            self.windtext.set_visible(True)
+        elif self.windtext is not None:
+            self.windtext.set_visible(False)
 
 
 psy.plot.mapvector.plotter_cls.meanmax_wind = MeanMaxWind("meanmax_wind")
@@ -1,8 +1,16 @@
 """Formatoption that adds rivers to mapplot, mapvector, and mapcombined plots created by psyplot."""
 
 import psyplot.project as psy
-from cartopy.feature import NaturalEarthFeature
-from psyplot.plotter import BEFOREPLOTTING, Formatoption
+from psyplot.plotter import Formatoption
+
+from ._features import _get_ne_feature, _rasterized, _shown, _simplify_tolerance
+
+
+def _rivers_feature(ax):
+    # rivers at 10m resolution, simplified to the resolution of the axes
+    return _get_ne_feature(
+        "physical", "rivers_lake_centerlines", "10m", _simplify_tolerance(ax)
+    )
 
 
 class Rivers(Formatoption):
@@ -10,22 +18,32 @@ class Rivers(Formatoption):
 
     #: the default value for the formatoption
     default = None
-    priority = BEFOREPLOTTING
+    dependencies = ["map_extent"]
     name = "Display Rivers"
 
+    #: the feature artist of the rivers, if drawn
+    rivers = None
+
+    #: the value and map extent of the last update
+    _last_state = None
+
     def validate(self, value):
-        """Validate and convert the input to boolean."""  # noqa
-        if not isinstance(value, bool):
-            return bool(value)
-        return value
+        """Validate and convert the input to boolean or dictionary."""  # noqa
+        if isinstance(value, dict):
+            return dict(value)
+        return bool(value)
 
     def initialize_plot(self, value):
         """Initialize the plot with or without rivers."""  # noqa
-        rivers10m = NaturalEarthFeature("physical", "rivers_lake_centerlines", "10m")
         self.rivers = None
-        if value is True and self.rivers is None:
+        self._last_state = (value, self.ax.get_extent())
+        if _shown(value) and self.rivers is None:
             self.rivers = self.ax.add_feature(
-                rivers10m, linewidth=0.5, edgecolors="black", facecolors="none"
+                _rivers_feature(self.ax),
+                linewidth=0.5,
+                edgecolors="black",
+                facecolors="none",
+                rasterized=_rasterized(value),
             )
         elif value is False:
             self._remove()
@@ -36,22 +54,29 @@ class Rivers(Formatoption):
 
         Parameters
         ----------
-        value: bool
+        value: bool or Dict
             True to add rivers, and False to remove.
+            The rivers are rasterized when saving to vector formats, unless a Dict with "rasterized": False is given.
         """
-        rivers10m = NaturalEarthFeature("physical", "rivers_lake_centerlines", "10m")
-        if value is True:
+        state = (value, self.ax.get_extent())
+        if state == self._last_state:
+            return
+        self._remove()
+        if _shown(value):
             self.rivers = self.ax.add_feature(
-                rivers10m, linewidth=0.1, edgecolors="black", facecolors="none"
+                _rivers_feature(self.ax),
+                linewidth=0.1,
+                edgecolors="black",
+                facecolors="none",
+                rasterized=_rasterized(value),
             )
-        elif value is False or value is None:
-            self._remove()
+        self._last_state = state
 
     def _remove(self):
         if self.rivers is None:
             return
         self.rivers.remove()
-        del self.rivers
+        self.rivers = None
 
 
 psy.plot.mapplot.plotter_cls.rivers = Rivers("rivers")
@@ -2,6 +2,7 @@
 
 import psyplot.project as psy
 from psy_simple.base import TextBase
+from psyplot.data import InteractiveList
 from psyplot.plotter import Formatoption
 
 
@@ -15,6 +16,15 @@ class StandardTitle(TextBase, Formatoption):
 
     default = True
 
+    #: the strftime template of the time title
+    _TIME_FMT = "%A %e %b %Y\n %d.%m.%Y %H:%M:%S"
+
+    #: the right and left title artists
+    standardtitle = ()
+
+    #: the right and left title strings of the last update, and the key they depend on
+    _last_titles = (None, None)
+
     @property
     def enhanced_attrs(self):  # noqa
         return self.get_fig_data_attrs()
@@ -23,13 +33,14 @@ class StandardTitle(TextBase, Formatoption):
         """Validate and convert the plot attributes to required format for update function."""  # noqa
         if s:
             try:
-                zname = self.get_enhanced_attrs(self.data)["zname"]
-                zvalue = self.get_enhanced_attrs(self.data)["z"]
+                attrs = self.get_enhanced_attrs(self.data)
+                zname = attrs["zname"]
+                zvalue = attrs["z"]
                 zdata = " on " + str(zname) + " " + str(zvalue)
             except Exception:
                 zdata = ""
             return {
-                "time": "%A %e %b %Y\n %d.%m.%Y %H:%M:%S",
+                "time": self._TIME_FMT,
                 "details": (f"%(long_name)s" f"{zdata}"),
             }
         else:
@@ -44,37 +55,45 @@ class StandardTitle(TextBase, Formatoption):
         s: Dict
             eg { "time": "%A %e %b %Y\n %d.%m.%Y %H:%M:%S", "details": 2m Temperature on Height level 10") }
         """
-        if type(s) is dict:
+        if isinstance(s, dict):
+            attrs = self.enhanced_attrs
+            key = (
+                s["time"],
+                s["details"],
+                attrs.get("long_name"),
+                attrs.get("z"),
+                self._time_value(),
+            )
+            if key != self._last_titles[0]:
+                titles = (
+                    self.replace(s["time"], self.plotter.data, attrs),
+                    self.replace(s["details"], self.plotter.data, attrs),
+                )
+                self._last_titles = (key, titles)
+            time_title, details_title = self._last_titles[1]
             self.standardtitle = [
-                self.ax.set_title(
-                    self.replace(s["time"], self.plotter.data, self.enhanced_attrs),
-                    loc="right",
-                ),
-                self.ax.set_title(
-                    self.replace(s["details"], self.plotter.data, self.enhanced_attrs),
-                    loc="left",
-                ),
+                self.ax.set_title(time_title, loc="right"),
+                self.ax.set_title(details_title, loc="left"),
             ]
-            self._clear_other_texts()
         else:
             self.standardtitle = [
                 self.ax.set_title("", loc="right"),
                 self.ax.set_title("", loc="left"),
             ]
 
-    def _clear_other_texts(self, remove=False):
-        fig = self.ax.get_figure()
-        # don't do anything if our figtitle is the only Text instance
-        if len(fig.texts) == 1:
-            return
-        for i, text in enumerate(fig.texts):
-            if text == self._text:
-                continue
-            if text.get_position() == self._text.get_position():
-                if not remove:
-                    text.set_text("")
-                else:
-                    del fig[i]
+    def _time_value(self):
+        # the scalar value of the time coordinate that TextBase.replace formats,
+        # which is not necessarily named time (eg. valid_time for cfgrib)
+        data = self.plotter.data
+        if isinstance(data, InteractiveList):
+            data = data[0]
+        tname = self.any_decoder.get_tname(
+            next(self.plotter.iter_base_variables), data.coords
+        )
+        if tname is None or tname not in data.coords:
+            return None
+        time = data.coords[tname]
+        return str(time.values) if not time.values.ndim else None
 
 
 psy.plot.mapplot.plotter_cls.standardtitle = StandardTitle("standardtitle")
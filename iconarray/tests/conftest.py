@@ -0,0 +1,152 @@
+"""Shared fixtures for the iconarray tests."""
+import io
+import os
+
+import cfgrib
+import netCDF4
+import pytest
+import xarray as xr
+
+import iconarray
+from iconarray.backend import grid
+
+f_alldata = "data/example_data/grib/lfff00010000_edgeplots"  # VN, VT AND cell center variables (P, T, U, V etc)
+
+# cfgrib options used to open the GRIB test data, the indexpath is added per session
+_BACKEND_KWARGS = {
+    "errors": "ignore",
+    "read_keys": ("typeOfLevel", "gridType"),
+    "filter_by_keys": {"typeOfLevel": "generalVerticalLayer"},
+}
+
+
+class _FakeFile(io.BytesIO):
+    """In-memory file recording the sizes it was read with."""
+
+    def __init__(self, payload, reads):
+        super().__init__(payload)
+        self._reads = reads
+
+    def read(self, size=-1):
+        self._reads.append(size)
+        return super().read(size)
+
+
+@pytest.fixture
+def fake_open(monkeypatch):
+    """
+    Return a factory patching open in the grid module to return the given content.
+
+    The factory returns the list of sizes the fake file was read with.
+    """
+
+    def make(payload):
+        reads = []
+        monkeypatch.setattr(
+            grid,
+            "open",
+            lambda *args, **kwargs: _FakeFile(payload, reads),
+            raising=False,
+        )
+        return reads
+
+    return make
+
+
+def _open_file(data, indexdir):
+    # the index is written next to the other indices of the session, and reused
+    # for the hypercubes of the file instead of being rebuilt for each of them
+    indexpath = os.path.join(indexdir, os.path.basename(data) + ".{short_hash}.idx")
+    dss = cfgrib.open_datasets(
+        data,
+        engine="cfgrib",
+        backend_kwargs=dict(_BACKEND_KWARGS, indexpath=indexpath),
+        encode_cf=("time", "geography", "vertical"),
+    )
+    ds_cell, ds_edge = dss
+    return ds_cell, ds_edge
+
+
+@pytest.fixture(scope="session")
+def grib_indexdir(tmp_path_factory):
+    """
+    Fixture that provides a directory for the cfgrib index files of the test session.
+
+    Returns
+    ----------
+    indexdir : str
+    """
+    return str(tmp_path_factory.mktemp("grib_index"))
+
+
+@pytest.fixture(scope="session")
+def alldata(grib_indexdir):
+    """
+    Fixture that provides tests with cell and edge datasets of GRIB file.
+
+    The GRIB file is only opened once per test session.
+
+    Returns
+    ----------
+    [ds_cell,ds_edge] : tuple[xr.Dataset,xr.Dataset]
+    """
+    ds_cell, ds_edge = _open_file(f_alldata, grib_indexdir)
+    return ds_cell, ds_edge
+
+
+@pytest.fixture(scope="session")
+def open_netcdf():
+    """
+    Fixture that provides tests with a function opening netCDF files, eg. ICON grid files.
+
+    Each file is only opened once per test session, so the returned
+    datasets must not be modified.
+
+    Returns
+    ----------
+    open_netcdf : Callable[[str], xr.Dataset]
+    """
+    datasets = {}
+
+    def _open_netcdf(file):
+        if file not in datasets:
+            datasets[file] = xr.open_dataset(file, engine="netcdf4")
+        return datasets[file]
+
+    yield _open_netcdf
+    for ds in datasets.values():
+        ds.close()
+
+
+@pytest.fixture(scope="session")
+def grid_dim_size():
+    """
+    Fixture that provides tests with a function returning the size of a dimension of a netCDF file.
+
+    Only the header of the file is read, the dataset is not decoded.
+
+    Returns
+    ----------
+    grid_dim_size : Callable[[str, str], int]
+    """
+
+    def _grid_dim_size(grid_file, dim):
+        with netCDF4.Dataset(grid_file) as nc:
+            return nc.dimensions[dim].size
+
+    return _grid_dim_size
+
+
+@pytest.fixture(scope="session")
+def opened_ds(request):
+    """
+    Fixture that provides tests with the data file given by indirect parametrization, opened with iconarray.
+
+    Each file is only opened once per test session, so the returned
+    datasets must not be modified.
+
+    Returns
+    ----------
+    ds : xr.Dataset | list[xr.Dataset]
+    """
+    return iconarray.open_dataset(request.param)
@@ -0,0 +1,97 @@
+"""tests for the config module."""
+import numpy as np
+import pytest
+
+import iconarray
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Write a config file and return its path."""
+
+    def write(text):
+        path = tmp_path / "config.ini"
+        path.write_text(text)
+        return str(path)
+
+    return write
+
+
+def test_read_config_defaults(config_file):
+    """Test that the defaults are set for the options missing in the config file."""
+    var, map_cfg, coord, plot = iconarray.read_config(config_file("[var]\nname = T\n"))
+
+    assert var == {"name": "T", "zname": "height", "time": [0], "height": [0]}
+    assert map_cfg == {
+        "sig": 0,
+        "sig_leg": 0,
+        "leg_loc": "best",
+        "alpha": 0.05,
+        "diff": "abs",
+        "col": "k",
+        "marker": ".",
+        "markersize": 0.5,
+    }
+    assert coord == {}
+    assert plot == {"date_format": "%Y-%m-%d %H:%M"}
+
+    # the returned lists are not shared with the defaults
+    var["time"].append(1)
+    assert iconarray.read_config(config_file("[var]\nname = T\n"))[0]["time"] == [0]
+
+
+def test_read_config_conversions(config_file):
+    """Test the conversion of float, int, boolean and list options."""
+    var, map_cfg, _, plot = iconarray.read_config(
+        config_file(
+            "[var]\n"
+            "name = T\n"
+            "varlim = 250 ,300.5\n"
+            "time = 0, 3 ,6\n"
+            "[map]\n"
+            "lonmin = 5.5\n"
+            "add_grid = False\n"
+            "sig = 2\n"
+            "sig_leg = yes  # inline comment\n"
+            "[plot]\n"
+            "xlim = 0,1\n"
+            "title = a ,b\n"
+        )
+    )
+
+    assert var["varlim"] == [250.0, 300.5]
+    assert var["time"] == [0, 3, 6]
+    assert map_cfg["lonmin"] == 5.5
+    assert map_cfg["add_grid"] is False
+    assert map_cfg["sig"] == 2
+    assert map_cfg["sig_leg"] is True
+    assert plot["xlim"] == [0.0, 1.0]
+    assert plot["title"] == "a ,b"
+
+
+def test_read_config_coord_broadcast(config_file):
+    """Test that a single marker, size and colour is used for all coordinates."""
+    _, _, coord, _ = iconarray.read_config(
+        config_file(
+            "[var]\n"
+            "name = T\n"
+            "[coord]\n"
+            "name = a ,b\n"
+            "lon = 8.5, 7.4\n"
+            "lat = 47.4, 46.9\n"
+            "col = b\n"
+        )
+    )
+
+    assert coord["name"] == ["a", "b"]
+    assert coord["lon"] == [8.5, 7.4]
+    assert coord["lat"] == [47.4, 46.9]
+    assert list(coord["marker"]) == ["*", "*"]
+    np.testing.assert_array_equal(coord["marker_size"], [10.0, 10.0])
+    assert list(coord["col"]) == ["b", "b"]
+
+
+def test_read_config_invalid_boolean(config_file):
+    """Test that an invalid boolean is rejected."""
+    with pytest.raises(ValueError, match="Not a boolean"):
+        iconarray.read_config(config_file("[var]\nname = T\n[map]\nadd_grid = maybe\n"))
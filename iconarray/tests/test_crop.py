@@ -67,5 +67,33 @@ def test_crop():
     )
 
 
+def test_crop_pass_through():
+    """Test a crop whose bounds contain the whole grid.
+
+    Data on the grid is returned unchanged, while data whose cell dimension differs
+    from the grid is still selected.
+    """
+    basedir = os.path.dirname(os.path.realpath(__file__))
+    in_cell_data = (
+        basedir + "/data/lfff00010000_lon_0.152-0.154_lat_0.8745-0.8755_cell.nc"
+    )
+    in_grid = (
+        basedir + "/data/icon_grid_0001_R19B08_lon_0.152-0.154_lat_0.8745-0.8755.nc"
+    )
+
+    ds_grid = xr.open_dataset(in_grid)
+    ds_cell = xr.open_dataset(in_cell_data)
+
+    crop = iconarray.Crop(ds_grid, [0, 1], [0, 1])
+
+    cell_cropped = crop(ds_cell)
+    assert cell_cropped is not ds_cell
+    xr.testing.assert_identical(cell_cropped, ds_cell)
+
+    ds_twice = xr.concat([ds_cell, ds_cell], dim="cell")
+    xr.testing.assert_identical(crop(ds_twice), ds_cell)
+
+
 if __name__ == "__main__":
     test_crop()
+    test_crop_pass_through()
@@ -0,0 +1,36 @@
+"""tests for the identification of the data type of files."""
+import os
+
+import pytest
+
+from iconarray.backend.grid import _identify_datatype
+
+
+@pytest.mark.parametrize(
+    "payload, datatype",
+    [
+        (b"CDF\x01", "nc"),
+        (b"\x89HDF", "nc"),
+        (b"GRIB", "grib"),
+        (b"text", False),
+    ],
+    ids=["netcdf3", "netcdf4", "grib", "unknown"],
+)
+def test_identify_datatype(fake_open, payload, datatype):
+    """Test that netCDF and GRIB files are told apart by their first bytes."""
+    reads = fake_open(payload)
+    assert _identify_datatype("mocked_file") == datatype
+    # only the magic number is read, not the whole file
+    assert reads and all(size == 4 for size in reads)
+
+
+def test_identify_datatype_modified_file(tmp_path):
+    """Test that the cached data type of a file is updated when the file is modified."""
+    file = tmp_path / "datafile"
+    file.write_bytes(b"GRIB")
+    assert _identify_datatype(file) == "grib"
+
+    file.write_bytes(b"CDF\x01")
+    mtime_ns = file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(file, ns=(mtime_ns, mtime_ns))
+    assert _identify_datatype(file) == "nc"
@@ -0,0 +1,52 @@
+"""tests for the features drawn by the formatoptions."""
+import cartopy.crs as ccrs
+import matplotlib.pyplot as plt
+import pytest
+import shapely
+
+from iconarray.plot.formatoptions._features import _CulledFeature, _simplify_tolerance
+
+
+def _lines():
+    # horizontal lines at y = 0, 1, ..., 9, from x = 0 to x = 1
+    return [shapely.LineString([(0, y), (1, y)]) for y in range(10)]
+
+
+def test_intersecting_geometries():
+    """Test that exactly the geometries intersecting the extent are returned, in their original order."""
+    lines = _lines()[::-1]
+    feature = _CulledFeature(lambda: lines, ccrs.PlateCarree())
+
+    found = list(feature.intersecting_geometries((0.5, 2, 2.5, 6.5)))
+
+    assert found == [line for line in lines if 2.5 <= line.coords[0][1] <= 6.5]
+    assert [line.coords[0][1] for line in found] == [6, 5, 4, 3]
+    assert list(feature.intersecting_geometries(None)) == lines
+
+
+def test_failed_load_is_retried():
+    """Test that the geometries are loaded again on the next call after a failed load."""
+    calls = []
+
+    def load():
+        calls.append(None)
+        if len(calls) == 1:
+            raise OSError("download failed")
+        return _lines()
+
+    feature = _CulledFeature(load, ccrs.PlateCarree())
+
+    with pytest.raises(OSError, match="download failed"):
+        list(feature.geometries())
+    assert len(list(feature.geometries())) == 10
+    assert len(calls) == 2
+
+
+def test_simplify_tolerance_zero_width():
+    """Test that geometries are not simplified on axes without width."""
+    fig = plt.figure()
+    ax = fig.add_axes([0, 0, 0, 1], projection=ccrs.PlateCarree())
+    try:
+        assert _simplify_tolerance(ax) == 0.0
+    finally:
+        plt.close(fig)
@@ -6,9 +6,7 @@ Contains tests: test_grid_edge, test_grid_cell
 
 import itertools
 
-import cfgrib
 import pytest
-import xarray as xr
 from xarray.testing import assert_identical
 
 import iconarray
@@ -18,36 +16,7 @@ f_alldata = "data/example_data/grib/lfff00010000_edgeplots"  # VN, VT AND cell c
 f_grid = "data/example_data/grids/icon_grid_0001_R19B08_mch.nc"  # GRID file
 
 
-def _open_file(data):
-    dss = cfgrib.open_datasets(
-        data,
-        engine="cfgrib",
-        backend_kwargs={
-            "indexpath": "",
-            "errors": "ignore",
-            "read_keys": ["typeOfLevel", "gridType"],
-            "filter_by_keys": {"typeOfLevel": "generalVerticalLayer"},
-        },
-        encode_cf=("time", "geography", "vertical"),
-    )
-    ds_cell, ds_edge = dss
-    return ds_cell, ds_edge
-
-
-@pytest.fixture(scope="module")
-def alldata():
-    """
-    Fixture that provides tests with cell and edge datasets of GRIB file.
-
-    Returns
-    ----------
-    [ds_cell,ds_edge] : tuple[xr.Dataset,xr.Dataset]
-    """
-    ds_cell, ds_edge = _open_file(f_alldata)
-    return ds_cell, ds_edge
-
-
-def test_grid_edge(alldata):
+def test_grid_edge(alldata, grid_dim_size):
     """
     Test the combine_grid_information function with a GRIB file containing both edge and cell center variables.
 
@@ -57,21 +26,22 @@ def test_grid_edge(alldata):
     ----------
     alldata : tuple[xr.Dataset,xr.Dataset]
         dataset containing variables defined on the grid cell and edge.
+    grid_dim_size : Callable[[str, str], int]
+        function returning the size of a dimension of the grid file.
     """
     _, ds_edge = alldata
-    ds_edge = ds_edge.copy()
 
     ds_edgevars = iconarray.combine_grid_information(ds_edge, f_grid)
 
-    ds_grid = iconarray.open_dataset(f_grid)
+    n_edge = grid_dim_size(f_grid, "edge")
 
     assert list(ds_edgevars.data_vars) == [
         "VN",
         "VT",
     ], "ds_edgevars should only have two data variables, ['VN', 'VT']"
     assert (
-        len(ds_edgevars.edge.values) == ds_grid.dims["edge"]
-    ), f"ds_edgevars should have a dimension edge, with length {ds_grid.dims['edge']}."
+        len(ds_edgevars.edge.values) == n_edge
+    ), f"ds_edgevars should have a dimension edge, with length {n_edge}."
     assert "edge" in list(
         ds_edgevars.VN.dims
     ), "ds_edgevars data variables should have a dimension edge"
@@ -83,7 +53,7 @@ def test_grid_edge(alldata):
     }, "ds_edgevars should have coordinates 'elon', 'elat', 'elon_bnds', 'elat_bnds'"
 
 
-def test_grid_cell(alldata):
+def test_grid_cell(alldata, grid_dim_size):
     """
     Test the combine_grid_information function with a GRIB file containing both edge and cell center variables.
 
@@ -93,13 +63,14 @@ def test_grid_cell(alldata):
     ----------
     alldata : tuple[xr.Dataset,xr.Dataset]
         dataset containing variables defined on the grid cell and edge.
+    grid_dim_size : Callable[[str, str], int]
+        function returning the size of a dimension of the grid file.
     """
     ds_cell, _ = alldata
-    ds_cell = ds_cell.copy()
 
     ds_cellvars = iconarray.combine_grid_information(ds_cell, f_grid)
 
-    ds_grid = iconarray.open_dataset(f_grid)
+    n_cell = grid_dim_size(f_grid, "cell")
 
     assert list(ds_cellvars.data_vars) == [
         "P",
@@ -111,8 +82,8 @@ def test_grid_cell(alldata):
         "QI",
     ], "ds_cellvars should only have two data variables, ['P', 'T', 'U', 'V', 'QV', 'QC', 'QI']"
     assert (
-        len(ds_cellvars.cell.values) == ds_grid.dims["cell"]
-    ), f"ds_cellvars should have a dimension 'cell', with length {ds_grid.dims['cell']}."
+        len(ds_cellvars.cell.values) == n_cell
+    ), f"ds_cellvars should have a dimension 'cell', with length {n_cell}."
     assert "cell" in list(
         ds_cellvars.P.dims
     ), "ds_cellvars data variables should have a dimension 'cell'"
@@ -124,7 +95,7 @@ def test_grid_cell(alldata):
     }, "ds_cellvars should have coordinates clon', 'clat', 'clon_bnds', 'clat_bnds'"
 
 
-def test_grid_dataset_cell(alldata):
+def test_grid_dataset_cell(alldata, open_netcdf):
     """
     Test the API of combine_grid_information that passes a dataset instead of a filename.
 
@@ -132,11 +103,12 @@ def test_grid_dataset_cell(alldata):
     ----------
     alldata : tuple[xr.Dataset,xr.Dataset]
         dataset containing variables defined on the grid cell and edge.
+    open_netcdf : Callable[[str], xr.Dataset]
+        function opening a netCDF file once per test session.
     """
-    grid_ds = xr.open_dataset(f_grid, engine="netcdf4")
+    grid_ds = open_netcdf(f_grid)
 
     ds_cell, _ = alldata
-    ds_cell = ds_cell.copy()
 
     ds_cellvars = iconarray.combine_grid_information(ds_cell, grid_ds)
 
@@ -145,12 +117,12 @@ def test_grid_dataset_cell(alldata):
     ), "ds_cellvars data variables should have a dimension 'cell'"
 
 
-def test_filter():
+@pytest.mark.parametrize("opened_ds", [f_alldata], indirect=True)
+def test_filter(opened_ds):
     """Test that we can filter a xarray.Dataset to a xarray.DataArray with a single variable."""
     ds_t = iconarray.open_dataset(f_alldata, "T")
 
-    ds = iconarray.open_dataset(f_alldata)
-    ds_t2 = iconarray.filter_by_var(ds, "T")
+    ds_t2 = iconarray.filter_by_var(opened_ds, "T")
 
     assert_identical(ds_t, ds_t2)
 
@@ -158,13 +130,13 @@ def test_filter():
     assert list(ds_t.data_vars)[0] == "T"
 
 
-def test_var_not_found():
+@pytest.mark.parametrize("opened_ds", [f_alldata], indirect=True)
+def test_var_not_found(opened_ds):
     """Test the output of vars available in the file if the requested var is not found."""
-    ds = iconarray.open_dataset(f_alldata)
+    ds = opened_ds
     var_list = list(itertools.chain.from_iterable([list(sds.keys()) for sds in ds]))
     try:
         _ = iconarray.open_dataset(f_alldata, "T_MISSING")
     except KeyError as e:
-        assert all(
-            [x in str(e) for x in var_list]
-        ), "list of variables in files incorrect"
+        msg = str(e)
+        assert all(x in msg for x in var_list), "list of variables in files incorrect"
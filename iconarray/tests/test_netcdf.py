@@ -5,7 +5,6 @@ Contains tests: test_wo_celldata, test_w_celldata, test_wrong_grid
 """
 
 import pytest
-import xarray as xr
 from xarray.testing import assert_identical
 
 import iconarray
@@ -22,7 +21,7 @@ f_grid = "data/example_data/grids/ICON-1E_DOM01.nc"
 @pytest.mark.parametrize(
     "file,grid_file", [(f_w_celldata1, f_grid), (f_w_celldata2, f_grid)]
 )
-def test_w_celldata(file, grid_file):
+def test_w_celldata(file, grid_file, grid_dim_size):
     """
     Test the combine_grid_information function with a NETCDF file containing cell center variables.
 
@@ -35,27 +34,26 @@ def test_w_celldata(file, grid_file):
 
     grid_file : str | Path
         Path to grid file.
+
+    grid_dim_size : Callable[[str, str], int]
+        function returning the size of a dimension of the grid file.
     """
     ds_cell = iconarray.combine_grid_information(file, grid_file)
 
-    ds_grid = iconarray.open_dataset(grid_file)
+    n_cell = grid_dim_size(grid_file, "cell")
 
     assert "cell" in list(
         ds_cell.T.dims
     ), "ds_cell data variables should have a dimension 'cell'"
     assert (
-        len(ds_cell.T.cell) == ds_grid.dims["cell"]
-    ), f"ds_cell should have a dimension 'cell', with length {ds_grid.dims['cell']}."
-    assert (
-        sum(
-            [
-                1
-                for coord in ["clon", "clat", "clon_bnds", "clat_bnds"]
-                if coord in ds_cell.coords
-            ]
-        )
-        == 4
-    ), "ds_cell should have coordinates 'clon', 'clat', 'clon_bnds', 'clat_bnds'"
+        len(ds_cell.T.cell) == n_cell
+    ), f"ds_cell should have a dimension 'cell', with length {n_cell}."
+    assert ds_cell.coords.keys() >= {
+        "clon",
+        "clat",
+        "clon_bnds",
+        "clat_bnds",
+    }, "ds_cell should have coordinates 'clon', 'clat', 'clon_bnds', 'clat_bnds'"
 
 
 def test_wrong_grid():
@@ -64,10 +62,10 @@ def test_wrong_grid():
         iconarray.combine_grid_information(f_celldata_incomatible_w_grid, f_grid)
 
 
-def test_grid_dataset_cell():
+def test_grid_dataset_cell(open_netcdf):
     """Test the API of combine_grid_information that passes a dataset instead of a filename."""
-    ds_cell = xr.open_dataset(f_w_celldata1, engine="netcdf4")
-    grid_ds = xr.open_dataset(f_grid, engine="netcdf4")
+    ds_cell = open_netcdf(f_w_celldata1)
+    grid_ds = open_netcdf(f_grid)
 
     ds_cell = iconarray.combine_grid_information(ds_cell, grid_ds)
 
@@ -76,12 +74,12 @@ def test_grid_dataset_cell():
     ), "ds_cell data variables should have a dimension 'cell'"
 
 
-def test_filter():
+@pytest.mark.parametrize("opened_ds", [f_w_celldata2], indirect=True)
+def test_filter(opened_ds):
     """Test that we can filter a xarray.Dataset to a xarray.DataArray with a single variable."""
     ds_t = iconarray.open_dataset(f_w_celldata2, "T")
 
-    ds = iconarray.open_dataset(f_w_celldata2)
-    ds_t2 = iconarray.filter_by_var(ds, "T")
+    ds_t2 = iconarray.filter_by_var(opened_ds, "T")
 
     assert_identical(ds_t, ds_t2)
 
@@ -89,12 +87,14 @@ def test_filter():
     assert list(ds_t.data_vars)[0] == "T"
 
 
-def test_var_not_found():
+@pytest.mark.parametrize("opened_ds", [f_w_celldata1], indirect=True)
+def test_var_not_found(opened_ds):
     """Test the output of vars available in the file if the requested var is not found."""
-    ds = iconarray.open_dataset(f_w_celldata1)
+    ds = opened_ds
     try:
         _ = iconarray.open_dataset(f_w_celldata1, "T_MISSING")
     except KeyError as e:
+        msg = str(e)
         assert all(
-            [x in str(e) for x in ds.data_vars]
+            x in msg for x in ds.data_vars
         ), "list of variables in files incorrect"
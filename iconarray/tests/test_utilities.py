@@ -0,0 +1,101 @@
+"""tests for utilities module."""
+import numpy as np
+import pytest
+import xarray as xr
+from scipy import stats
+
+import iconarray
+
+
+def _random_grid(n=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    lon = xr.DataArray(rng.uniform(-0.2, 0.4, n), dims="cell")
+    lat = xr.DataArray(rng.uniform(0.7, 0.9, n), dims="cell")
+    return lon, lat
+
+
+def test_ind_from_latlon_modified_in_place():
+    """Test that coordinates converted in place are used by later calls."""
+    lon, lat = _random_grid()
+    iconarray.ind_from_latlon(lon, lat, 8.54, 47.38)
+    np.rad2deg(lon.values, out=lon.values)
+    np.rad2deg(lat.values, out=lat.values)
+
+    ind = iconarray.ind_from_latlon(lon, lat, 8.54, 47.38)
+    expected = iconarray.ind_from_latlon(lon.copy(), lat.copy(), 8.54, 47.38)
+    np.testing.assert_array_equal(ind, expected)
+
+
+def test_ind_from_latlon_cache():
+    """Test that the cached BallTree gives the same indices as a new one."""
+    lon, lat = (np.rad2deg(coord) for coord in _random_grid())
+    for lon_point, lat_point in [(8.54, 47.38), (6.14, 46.2), (-3.0, 45.0)]:
+        expected = iconarray.ind_from_latlon(lon, lat, lon_point, lat_point, n=3)
+        for _ in range(2):
+            ind = iconarray.ind_from_latlon(
+                lon, lat, lon_point, lat_point, n=3, cache=True
+            )
+            np.testing.assert_array_equal(ind, expected)
+
+
+def _random_samples(seed=0):
+    rng = np.random.default_rng(seed)
+    sample1 = rng.normal(0.0, 1.0, (10, 4, 5))
+    sample2 = rng.normal(0.3, 1.5, (12, 4, 5))
+    return sample1, sample2
+
+
+@pytest.mark.parametrize("chunked", [False, True], ids=["numpy", "dask"])
+def test_get_stats(chunked):
+    """Test that get_stats matches scipy.stats.ttest_ind."""
+    sample1, sample2 = _random_samples()
+    expected = stats.ttest_ind(sample1, sample2, axis=0).pvalue
+    varin1, varin2 = sample1, sample2
+    if chunked:
+        da = pytest.importorskip("dask.array")
+        varin1 = da.from_array(sample1, chunks=(5, 2, 5))
+        varin2 = da.from_array(sample2, chunks=(6, 2, 5))
+
+    mean1, mean2, diff, pval = (
+        np.asarray(x) for x in iconarray.get_stats(varin1, varin2)
+    )
+
+    np.testing.assert_allclose(mean1, np.mean(sample1, axis=0))
+    np.testing.assert_allclose(diff, mean2 - mean1)
+    np.testing.assert_allclose(pval, expected)
+
+
+@pytest.mark.parametrize("chunked", [False, True], ids=["numpy", "dask"])
+def test_get_stats_da(chunked):
+    """Test that get_stats_da matches scipy.stats.ttest_ind along a dimension."""
+    sample1, sample2 = _random_samples()
+    expected = stats.ttest_ind(sample1, sample2, axis=0).pvalue
+    dims = ("time", "lat", "lon")
+    da1 = xr.DataArray(sample1, dims=dims)
+    da2 = xr.DataArray(sample2, dims=dims)
+    if chunked:
+        pytest.importorskip("dask")
+        da1 = da1.chunk({"time": -1, "lat": 2})
+        da2 = da2.chunk({"time": -1, "lat": 2})
+
+    mean1, mean2, diff, pval = iconarray.get_stats_da(da1, da2)
+
+    assert pval.dims == ("lat", "lon")
+    assert (pval.chunks is not None) == chunked
+    np.testing.assert_allclose(mean1, np.mean(sample1, axis=0))
+    np.testing.assert_allclose(diff, mean2 - mean1)
+    np.testing.assert_allclose(pval, expected)
+
+
+def test_get_stats_dataarray_nan():
+    """Test that get_stats gives the same p-values for xr.DataArray and numpy input with NaNs."""
+    sample1, sample2 = _random_samples()
+    sample1[0, 0, 0] = np.nan
+    dims = ("time", "lat", "lon")
+
+    pval = iconarray.get_stats(
+        xr.DataArray(sample1, dims=dims), xr.DataArray(sample2, dims=dims)
+    )[3]
+
+    assert np.isnan(pval[0, 0])
+    np.testing.assert_allclose(pval, iconarray.get_stats(sample1, sample2)[3])
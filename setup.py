@@ -40,10 +40,9 @@ setup(
         "psy-simple",
         "psy-maps",
         "numpy",
-        "six",
         "cartopy",
     ],  # Optional
     extras_require={
-        "tests": ["flake8", "pytest"],
+        "tests": ["flake8", "pytest", "pytest-xdist"],
     },
 )
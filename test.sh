@@ -10,4 +10,5 @@ python -c "import cartopy; print(cartopy.config)"
 
 python iconarray/utils/get_data.py
 
-pytest iconarray/tests
\ No newline at end of file
+# the test modules are distributed over the cores, each module runs on a single worker
+pytest -n auto --dist=loadscope iconarray/tests
\ No newline at end of file